@@ -35,11 +35,20 @@ final class AppModel: ObservableObject {
     func saveRecording(fileURL: URL, duration: TimeInterval, transcript: String? = nil) {
         Task {
             do {
-                _ = try await CloudKitService.shared.saveEntry(duration: duration, audioFileURL: fileURL, transcript: transcript)
-                let fetched = try await CloudKitService.shared.fetchEntries()
+                let saved = try await CloudKitService.shared.saveEntry(duration: duration, audioFileURL: fileURL, transcript: transcript)
 
-                await MainActor.run {
-                    self.entries = fetched
+                if self.entries == PreviewData.sampleEntries {
+                    // Launch refresh failed and the list still shows previews; replace them with real data
+                    let fetched = try await CloudKitService.shared.fetchEntries()
+                    await MainActor.run {
+                        self.entries = fetched
+                    }
+                } else {
+                    // Newest first, matching fetchEntries ordering; skips a full re-fetch
+                    await MainActor.run {
+                        self.entries.removeAll { $0.id == saved.id }
+                        self.entries.insert(saved, at: 0)
+                    }
                 }
 
                 // Remove temporary file after successful save
@@ -65,20 +65,13 @@ struct DayEntry: Identifiable, Hashable {
     }
 
     var formattedDate: String {
-        Self.dateFormatter.string(from: createdAt)
+        DateFormatter.mediumDateShortTime.string(from: createdAt)
     }
 
     var formattedSize: String {
         Self.byteCountFormatter.string(fromByteCount: Int64(sizeBytes))
     }
 
-    private static let dateFormatter: DateFormatter = {
-        let formatter = DateFormatter()
-        formatter.dateStyle = .medium
-        formatter.timeStyle = .short
-        return formatter
-    }()
-
     private static let byteCountFormatter: ByteCountFormatter = {
         let formatter = ByteCountFormatter()
         formatter.allowedUnits = [.useKB, .useMB]
@@ -144,9 +137,16 @@ struct ExportRequest: Identifiable, Hashable {
     let downloadURL: URL?
 
     var formattedDate: String {
+        DateFormatter.mediumDateShortTime.string(from: createdAt)
+    }
+}
+
+extension DateFormatter {
+    /// Medium date, short time; shared by entry titles and list rows.
+    static let mediumDateShortTime: DateFormatter = {
         let formatter = DateFormatter()
         formatter.dateStyle = .medium
         formatter.timeStyle = .short
-        return formatter.string(from: createdAt)
-    }
+        return formatter
+    }()
 }
@@ -60,9 +60,13 @@ final class AudioRecorder: NSObject, AVAudioRecorderDelegate {
     }
 
     private static func makeOutputURL() -> URL {
-        let formatter = DateFormatter()
-        formatter.dateFormat = "yyyyMMdd_HHmmss"
-        let name = "MyDay_\(formatter.string(from: Date())).m4a"
+        let name = "MyDay_\(fileDateFormatter.string(from: Date())).m4a"
         return FileManager.default.temporaryDirectory.appendingPathComponent(name)
     }
+
+    private static let fileDateFormatter: DateFormatter = {
+        let df = DateFormatter()
+        df.dateFormat = "yyyyMMdd_HHmmss"
+        return df
+    }()
 }
@@ -18,6 +18,7 @@ public final class CloudKitService {
     // MARK: - Public API
 
     /// Saves a new entry with the provided local audio file. The file is uploaded as a CKAsset.
+    /// Returns the entry built from the saved record, so callers need not re-fetch.
     @discardableResult
     public func saveEntry(
         id: UUID = UUID(),
@@ -25,7 +26,7 @@ public final class CloudKitService {
         duration: TimeInterval,
         audioFileURL: URL,
         transcript: String? = nil
-    ) async throws -> CKRecord.ID {
+    ) async throws -> DayEntry {
         let record = CKRecord(recordType: RecordType.entry)
         record[Field.id] = id.uuidString as CKRecordValue
         record[Field.createdAt] = createdAt as CKRecordValue
@@ -37,7 +38,8 @@ public final class CloudKitService {
         record[Field.audio] = CKAsset(fileURL: audioFileURL)
 
         let saved = try await save(record: record)
-        return saved.recordID
+        guard let entry = Self.dayEntry(from: saved) else { throw CKError(.unknownItem) }
+        return entry
     }
 
     /// Fetches entries, optionally filtered by last updated date.
@@ -51,20 +53,22 @@ public final class CloudKitService {
         let query = CKQuery(recordType: RecordType.entry, predicate: predicate)
         query.sortDescriptors = [NSSortDescriptor(key: Field.createdAt, ascending: false)]
 
-        var all: [CKRecord] = []
+        // Map each page as it arrives so raw CKRecords are not held for the whole fetch
+        var entries: [DayEntry] = []
         var cursor: CKQueryOperation.Cursor?
 
         repeat {
-            let page: QueryPage = try await performQuery(query: query, cursor: cursor)
-            all.append(contentsOf: page.records)
+            let page: QueryPage = try await performQuery(query: query, cursor: cursor, desiredKeys: Self.listKeys)
+            entries.append(contentsOf: page.records.compactMap { Self.dayEntry(from: $0) })
             cursor = page.cursor
         } while cursor != nil
 
-        return all.compactMap { Self.dayEntry(from: $0) }
+        return entries
     }
 
-    /// Fetch CKRecords for export, including `audio` and transcript fields.
-    public func fetchEntryRecords(updatedSince: Date? = nil) async throws -> [CKRecord] {
+    /// Fetch CKRecords for export, including `audio` and transcript fields, handing them to
+    /// `body` one page at a time so earlier pages' records need not be held until the end.
+    public func forEachEntryRecordPage(updatedSince: Date? = nil, _ body: ([CKRecord]) throws -> Void) async throws {
         let predicate: NSPredicate
         if let since = updatedSince {
             predicate = NSPredicate(format: "%K > %@", Field.updatedAt, since as NSDate)
@@ -72,16 +76,13 @@ public final class CloudKitService {
             predicate = NSPredicate(value: true)
         }
         let query = CKQuery(recordType: RecordType.entry, predicate: predicate)
-        let desiredKeys = [Field.id, Field.createdAt, Field.duration, Field.sizeBytes, Field.status, Field.updatedAt, Field.transcriptClean, Field.audio]
 
-        var all: [CKRecord] = []
         var cursor: CKQueryOperation.Cursor?
         repeat {
-            let page: QueryPage = try await performQuery(query: query, cursor: cursor, desiredKeys: desiredKeys)
-            all.append(contentsOf: page.records)
+            let page: QueryPage = try await performQuery(query: query, cursor: cursor, desiredKeys: Self.exportKeys)
+            try body(page.records)
             cursor = page.cursor
         } while cursor != nil
-        return all
     }
 
     /// Returns the local file URL for the audio asset of an entry with the given id, if available.
@@ -113,6 +114,12 @@ public final class CloudKitService {
         static let audio = "audio" // CKAsset
     }
 
+    /// Only the fields dayEntry(from:) reads; leaving out `audio` avoids downloading every asset.
+    private static let listKeys = [Field.id, Field.createdAt, Field.duration, Field.sizeBytes, Field.status, Field.transcriptClean]
+
+    /// Everything the local export writes, including the audio asset.
+    private static let exportKeys = [Field.id, Field.createdAt, Field.duration, Field.sizeBytes, Field.status, Field.updatedAt, Field.transcriptClean, Field.audio]
+
     private func fileSize(at url: URL) throws -> NSNumber {
         let values = try url.resourceValues(forKeys: [.fileSizeKey])
         return NSNumber(value: values.fileSize ?? 0)
@@ -159,7 +166,7 @@ public final class CloudKitService {
         let statusRaw = (record[Field.status] as? String) ?? "uploaded"
         let transcriptClean = record[Field.transcriptClean] as? String
         let transcriptPreview = transcriptClean.map { String($0.prefix(160)) } ?? ""
-        let title = DateFormatter.localizedString(from: createdAt, dateStyle: .medium, timeStyle: .short)
+        let title = DateFormatter.mediumDateShortTime.string(from: createdAt)
 
         return DayEntry(
             id: id,
@@ -5,27 +5,39 @@ public enum LocalExportService {
     /// Builds a folder with audio and transcript files for all entries and returns the folder URL.
     public static func exportAllEntries() async throws -> URL {
         let ck = CloudKitService.shared
-        let records = try await ck.fetchEntryRecords()
         let exportDir = try makeExportDirectory()
 
-        for record in records {
-            guard let createdAt = record["updatedAt"] as? Date ?? record["createdAt"] as? Date else { continue }
-            let base = filenameDateFormatter.string(from: createdAt)
-
-            if let transcript = record["transcriptClean"] as? String, !transcript.isEmpty {
-                let txtURL = exportDir.appendingPathComponent("\(base).txt")
-                try transcript.data(using: .utf8)?.write(to: txtURL)
-            }
-
-            if let asset = record["audio"] as? CKAsset, let fileURL = asset.fileURL {
-                let m4aURL = exportDir.appendingPathComponent("\(base).m4a")
-                try copyReplacingIfExists(from: fileURL, to: m4aURL)
+        // Write each page as it arrives rather than holding every record at once
+        do {
+            try await ck.forEachEntryRecordPage { records in
+                for record in records {
+                    try write(record: record, into: exportDir)
+                }
             }
+        } catch {
+            // Don't leave a half-written export behind if a later page fails
+            try? FileManager.default.removeItem(at: exportDir)
+            throw error
         }
 
         return exportDir
     }
 
+    private static func write(record: CKRecord, into exportDir: URL) throws {
+        guard let createdAt = record["updatedAt"] as? Date ?? record["createdAt"] as? Date else { return }
+        let base = filenameDateFormatter.string(from: createdAt)
+
+        if let transcript = record["transcriptClean"] as? String, !transcript.isEmpty {
+            let txtURL = exportDir.appendingPathComponent("\(base).txt")
+            try transcript.data(using: .utf8)?.write(to: txtURL)
+        }
+
+        if let asset = record["audio"] as? CKAsset, let fileURL = asset.fileURL {
+            let m4aURL = exportDir.appendingPathComponent("\(base).m4a")
+            try copyReplacingIfExists(from: fileURL, to: m4aURL)
+        }
+    }
+
     private static func makeExportDirectory() throws -> URL {
         let ts = compactDateFormatter.string(from: Date())
         let dir = FileManager.default.temporaryDirectory.appendingPathComponent("MyDayExport_\(ts)", isDirectory: true)